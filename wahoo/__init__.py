@@ -5,7 +5,12 @@ from .validator.scoring.dataframe import (
     ensure_required_columns,
     flatten_record,
 )
-from .validator.scoring.operators import Operator, OperatorResult, EMAVolumeScorer
+from .validator.scoring.operators import (
+    Operator,
+    OperatorResult,
+    EMAState,
+    EMAVolumeScorer,
+)
 from .validator.scoring.pipeline import OperatorPipeline
 
 __all__ = [
@@ -18,6 +23,7 @@ __all__ = [
     "flatten_record",
     "Operator",
     "OperatorResult",
+    "EMAState",
     "EMAVolumeScorer",
     "OperatorPipeline",
 ]
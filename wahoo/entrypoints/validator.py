@@ -1,41 +1,47 @@
 import argparse
 import logging
-import os
+import time
+from functools import lru_cache
 
 from wahoo.validator.validator import (
+    LOG_BANNER,
     WAHOO_API_URL,
-    WAHOO_VALIDATION_ENDPOINT,
+    ValidatorConfig,
     calculate_loop_interval,
     initialize_bittensor,
+    load_env_settings,
     main_loop_iteration,
 )
+from wahoo.validator.api import close_shared_session
 from wahoo.validator.database.core import ValidatorDB
 from wahoo.validator.database.validator_db import check_database_exists, get_db_path, run_alembic_migrations
 from wahoo.validator.init import initialize
 
 
-def main() -> None:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="WaHoo Predict Bittensor Validator",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
+    env = load_env_settings()
 
     parser.add_argument(
         "--netuid",
         type=int,
-        default=int(os.getenv("NETUID", "0")),
+        default=env["netuid"],
         help="Subnet UID (required for production)",
     )
     parser.add_argument(
         "--network",
         type=str,
-        default=os.getenv("NETWORK", "finney"),
+        default=env["network"],
         help="Bittensor network (test or finney). Default: finney",
     )
     parser.add_argument(
         "--chain-endpoint",
         type=str,
-        default=os.getenv("CHAIN_ENDPOINT", None),
+        default=env["chain_endpoint"],
         dest="chain_endpoint",
         help="Custom chain endpoint URL (overrides network if set). For advanced use only.",
     )
@@ -43,31 +49,31 @@ def main() -> None:
     parser.add_argument(
         "--wallet.name",
         type=str,
-        default=os.getenv("WALLET_NAME"),
+        default=env["wallet_name"],
         dest="wallet_name",
-        required=os.getenv("WALLET_NAME") is None,
+        required=env["wallet_name"] is None,
         help="Wallet name (coldkey). Required if WALLET_NAME env var not set.",
     )
     parser.add_argument(
         "--wallet.hotkey",
         type=str,
-        default=os.getenv("HOTKEY_NAME"),
+        default=env["hotkey_name"],
         dest="hotkey_name",
-        required=os.getenv("HOTKEY_NAME") is None,
+        required=env["hotkey_name"] is None,
         help="Hotkey name. Required if HOTKEY_NAME env var not set.",
     )
 
     parser.add_argument(
         "--use-validator-db",
         action="store_true",
-        default=os.getenv("USE_VALIDATOR_DB", "false").lower() == "true",
+        default=env["use_validator_db"],
         dest="use_validator_db",
         help="Enable ValidatorDB caching",
     )
     parser.add_argument(
         "--validator-db-path",
         type=str,
-        default=os.getenv("VALIDATOR_DB_PATH", "validator.db"),
+        default=env["validator_db_path"],
         dest="validator_db_path",
         help="Path to validator database",
     )
@@ -75,7 +81,7 @@ def main() -> None:
     parser.add_argument(
         "--log-level",
         type=str,
-        default=os.getenv("LOG_LEVEL", "INFO"),
+        default=env["log_level"],
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         dest="log_level",
         help="Logging level",
@@ -84,14 +90,14 @@ def main() -> None:
     parser.add_argument(
         "--wahoo-api-url",
         type=str,
-        default=os.getenv("WAHOO_API_URL", WAHOO_API_URL),
+        default=env["wahoo_api_url"],
         dest="wahoo_api_url",
         help="WAHOO API URL (overrides default)",
     )
     parser.add_argument(
         "--wahoo-validation-endpoint",
         type=str,
-        default=os.getenv("WAHOO_VALIDATION_ENDPOINT", WAHOO_VALIDATION_ENDPOINT),
+        default=env["wahoo_validation_endpoint"],
         dest="wahoo_validation_endpoint",
         help="WAHOO validation endpoint URL (overrides default)",
     )
@@ -102,8 +108,27 @@ def main() -> None:
         dest="loop_interval",
         help="Override loop interval in seconds (default: calculated from metagraph)",
     )
+    return parser
+
+
+def _config_from_args(args: argparse.Namespace) -> ValidatorConfig:
+    env = load_env_settings()
+    return ValidatorConfig(
+        netuid=args.netuid,
+        network=args.network,
+        wallet_name=args.wallet_name,
+        hotkey_name=args.hotkey_name,
+        use_validator_db=args.use_validator_db,
+        wahoo_api_url=args.wahoo_api_url,
+        wahoo_validation_endpoint=args.wahoo_validation_endpoint,
+        chain_endpoint=args.chain_endpoint,
+        sync_block_delta=env["sync_block_delta"],
+        use_dataframe_scoring=env["use_dataframe_scoring"],
+    )
 
-    args = parser.parse_args()
+
+def main() -> None:
+    args = _build_parser().parse_args()
 
     log_level = getattr(logging, args.log_level.upper())
     logging.basicConfig(
@@ -114,9 +139,9 @@ def main() -> None:
 
     logger = logging.getLogger(__name__)
 
-    logger.info("=" * 70)
+    logger.info(LOG_BANNER)
     logger.info("WaHoo Predict Validator")
-    logger.info("=" * 70)
+    logger.info(LOG_BANNER)
 
     db_path = get_db_path()
     if not check_database_exists(db_path):
@@ -145,31 +170,22 @@ def main() -> None:
         )
         return
 
-    config = {
-        "netuid": args.netuid,
-        "network": args.network,
-        "wallet_name": args.wallet_name,
-        "hotkey_name": args.hotkey_name,
-        "use_validator_db": args.use_validator_db,
-        "wahoo_api_url": args.wahoo_api_url,
-        "wahoo_validation_endpoint": args.wahoo_validation_endpoint,
-        "chain_endpoint": args.chain_endpoint,
-    }
+    config = _config_from_args(args)
 
     logger.info("Configuration:")
-    logger.info(f"  Network: {config['network']}")
-    logger.info(f"  Subnet UID: {config['netuid']}")
-    logger.info(f"  Wallet: {config['wallet_name']}/{config['hotkey_name']}")
-    logger.info(f"  ValidatorDB: {config['use_validator_db']}")
+    logger.info(f"  Network: {config.network}")
+    logger.info(f"  Subnet UID: {config.netuid}")
+    logger.info(f"  Wallet: {config.wallet_name}/{config.hotkey_name}")
+    logger.info(f"  ValidatorDB: {config.use_validator_db}")
     logger.info(f"  WAHOO API: {WAHOO_API_URL}")
 
     try:
         wallet, subtensor, dendrite, metagraph = initialize_bittensor(
-            wallet_name=config["wallet_name"],
-            hotkey_name=config["hotkey_name"],
-            netuid=config["netuid"],
-            network=config["network"],
-            chain_endpoint=config.get("chain_endpoint"),
+            wallet_name=config.wallet_name,
+            hotkey_name=config.hotkey_name,
+            netuid=config.netuid,
+            network=config.network,
+            chain_endpoint=config.chain_endpoint,
         )
     except Exception as e:
         logger.error(f"Failed to initialize Bittensor: {e}")
@@ -189,7 +205,7 @@ def main() -> None:
         )
 
     validator_db = None
-    if config["use_validator_db"]:
+    if config.use_validator_db:
         try:
             validator_db = ValidatorDB(db_path=get_db_path())
             logger.info(f"ValidatorDB initialized at {get_db_path()}")
@@ -200,9 +216,11 @@ def main() -> None:
     logger.info("Entering main loop...")
     logger.info("Press Ctrl+C to stop")
 
-    import time
-
     iteration_count = 0
+    # A fixed --loop-interval is scheduled against a monotonic deadline so
+    # iteration time doesn't stretch the period. A computed interval is already
+    # measured from now to the next epoch boundary, so it is slept as is.
+    next_deadline = time.monotonic()
     try:
         while True:
             main_loop_iteration(
@@ -210,25 +228,39 @@ def main() -> None:
                 subtensor=subtensor,
                 dendrite=dendrite,
                 metagraph=metagraph,
-                netuid=config["netuid"],
+                netuid=config.netuid,
                 config=config,
                 validator_db=validator_db,
                 iteration_count=iteration_count,
             )
             iteration_count += 1
 
-            # Recalculate loop interval from metagraph if not overridden
-            # This allows the interval to adapt if metagraph tempo changes
             if args.loop_interval is None:
+                # Recalculate from the metagraph so the loop stays on epoch boundaries
                 loop_interval = calculate_loop_interval(metagraph, subtensor=subtensor)
-            logger.info(f"Sleeping for {loop_interval:.1f}s before next iteration...")
-            time.sleep(loop_interval)
+                sleep_for = loop_interval
+            else:
+                next_deadline += loop_interval
+                now = time.monotonic()
+                if next_deadline < now:
+                    # Iteration overran its slot; start the next one right away
+                    logger.warning(
+                        "Iteration overran the %.1fs loop interval by %.1fs; "
+                        "starting the next iteration immediately",
+                        loop_interval,
+                        now - next_deadline,
+                    )
+                    next_deadline = now
+                sleep_for = next_deadline - now
+            logger.info("Sleeping for %.1fs before next iteration...", sleep_for)
+            time.sleep(sleep_for)
 
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
     except Exception as e:
         logger.error(f"Fatal error in main loop: {e}", exc_info=True)
     finally:
+        close_shared_session()
         logger.info("Validator stopped")
 
 
@@ -7,8 +7,11 @@ from .client import (
     ValidatorDBInterface,
     WAHOO_API_BACKOFF_SECONDS,
     WAHOO_API_MAX_RETRIES,
+    close_shared_session,
     get_active_event_id,
+    get_shared_session,
     get_wahoo_validation_data,
+    is_api_reachable,
 )
 from .fallback import (
     filter_usable_records,
@@ -22,6 +25,9 @@ __all__ = [
     "ValidatorDBInterface",
     "get_wahoo_validation_data",
     "get_active_event_id",
+    "get_shared_session",
+    "close_shared_session",
+    "is_api_reachable",
     "DEFAULT_VALIDATION_ENDPOINT",
     "WAHOO_API_MAX_RETRIES",
     "WAHOO_API_BACKOFF_SECONDS",
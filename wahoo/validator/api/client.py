@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 import os
+import threading
 import time
 from datetime import datetime
 from types import TracebackType
-from typing import Any, Dict, List, NoReturn, Optional, Sequence, Set, Type
+from typing import Any, Dict, List, NoReturn, Optional, Sequence, Set, Tuple, Type
 
 import bittensor as bt
 import httpx
@@ -14,6 +16,20 @@ from pydantic import ValidationError
 from ..scoring.models import ValidationRecord
 from .fallback import filter_usable_records
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import h2  # noqa: F401  (httpx's HTTP/2 support needs it installed)
+
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
 load_dotenv()
 
 DEFAULT_VALIDATION_ENDPOINT = (
@@ -27,14 +43,125 @@ WAHOO_API_MAX_RETRIES = 2
 WAHOO_API_BACKOFF_SECONDS = 1.0
 
 EVENT_ID_MAX_RETRIES = 0
+EVENT_ID_CACHE_TTL_SECONDS = 300.0
+EVENT_ID_STALE_IF_ERROR_SECONDS = 600.0
+
+API_PROBE_TIMEOUT_SECONDS = 3.0
+API_PROBE_CACHE_TTL_SECONDS = 30.0
 
 SET_WEIGHTS_MAX_RETRIES = 1
 
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+
+_shared_session: Optional[httpx.Client] = None
+_shared_session_lock = threading.Lock()
+
+# The events-list query never changes, so serialize it once
+_EVENTS_LIST_QUERY = {
+    "page": 1,
+    "limit": 20,
+    "sort": {"sortBy": "estimatedEnd", "sortOrder": "desc"},
+    "filter": {"status": ["LIVE"]},
+}
+_EVENTS_LIST_BODY: bytes = (
+    orjson.dumps(_EVENTS_LIST_QUERY)
+    if HAS_ORJSON
+    else json.dumps(_EVENTS_LIST_QUERY).encode()
+)
+
+# Keys tried in order when pulling an event ID out of an events-list payload
+_EVENT_ITEM_ID_KEYS = ("id", "event_id", "_id")
+_EVENT_PAYLOAD_ID_KEYS = ("active_event_id", "event_id", "id", "event")
+
+# base_url -> (event_id, fetched_at monotonic time)
+_event_id_cache: Dict[str, Tuple[str, float]] = {}
+
+# origin -> (reachable, expires_at monotonic time)
+_api_probe_cache: Dict[str, Tuple[bool, float]] = {}
+
+
+def get_shared_session() -> httpx.Client:
+    """
+    Return the process-wide pooled HTTP client for WAHOO API calls.
+
+    Reusing one client keeps TCP/TLS connections alive across iterations
+    instead of paying a fresh handshake per request. HTTP/2 is negotiated
+    when the optional h2 package is installed.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None or _shared_session.is_closed:
+            _shared_session = httpx.Client(limits=HTTP_POOL_LIMITS, http2=HAS_H2)
+        return _shared_session
+
+
+def is_api_reachable(
+    url: str,
+    *,
+    timeout: float = API_PROBE_TIMEOUT_SECONDS,
+    session: Optional[httpx.Client] = None,
+    cache_ttl: float = API_PROBE_CACHE_TTL_SECONDS,
+) -> bool:
+    """
+    Cheap liveness probe: HEAD the origin of url with a short timeout.
+
+    Transport-level failures (DNS, connect, timeout) and 5xx responses count
+    as down; any other HTTP response counts as reachable. Results are cached
+    per origin for cache_ttl seconds.
+    """
+    origin = str(httpx.URL(url).copy_with(path="/", query=None, fragment=None))
+
+    cached = _api_probe_cache.get(origin)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
+    client = session or get_shared_session()
+    try:
+        response = client.head(origin, timeout=timeout)
+        reachable = response.status_code < 500
+        if not reachable:
+            bt.logging.warning(
+                f"WAHOO API liveness probe for {origin} returned "
+                f"{response.status_code}"
+            )
+    except httpx.HTTPError as exc:
+        bt.logging.warning(f"WAHOO API liveness probe failed for {origin}: {exc}")
+        reachable = False
+
+    if cache_ttl > 0:
+        _api_probe_cache[origin] = (reachable, time.monotonic() + cache_ttl)
+    return reachable
+
+
+def close_shared_session() -> None:
+    """Close the process-wide HTTP client; the next call creates a new one."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
+
 
 class ValidationAPIError(RuntimeError):
     pass
 
 
+def _response_json(response: httpx.Response) -> Any:
+    # orjson.JSONDecodeError subclasses ValueError, like response.json() errors
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _first_present(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    # Same semantics as chaining data.get(k1) or data.get(k2) or ...
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
 def _parse_iso8601(value: str) -> datetime:
     normalized = value.strip()
     if normalized.endswith("Z"):
@@ -155,7 +282,7 @@ class ValidationAPIClient:
                 )
 
             try:
-                response = self._session.get(url, params=params)
+                response = self._session.get(url, params=params, timeout=self.timeout)
             except httpx.TimeoutException as exc:
                 bt.logging.error(
                     f"ValidationAPI request timed out after {self.timeout}s "
@@ -205,7 +332,7 @@ class ValidationAPIClient:
     @staticmethod
     def _extract_payload(response: httpx.Response) -> List[Dict[str, Any]]:
         try:
-            data = response.json()
+            data = _response_json(response)
         except ValueError as exc:
             raise ValidationAPIError(
                 "Validation endpoint returned invalid JSON"
@@ -221,7 +348,7 @@ class ValidationAPIClient:
 
     def _log_and_raise(self, response: httpx.Response) -> NoReturn:
         try:
-            payload = response.json()
+            payload = _response_json(response)
         except ValueError:
             payload = response.text
         bt.logging.error(
@@ -238,7 +365,17 @@ def get_active_event_id(
     *,
     timeout: float = 10.0,
     default_event_id: str = "wahoo_test_event",
+    session: Optional[httpx.Client] = None,
+    cache_ttl: float = EVENT_ID_CACHE_TTL_SECONDS,
+    stale_if_error: float = EVENT_ID_STALE_IF_ERROR_SECONDS,
 ) -> str:
+    """
+    Return the active event ID, serving it from a short-lived cache when fresh.
+
+    Only IDs actually returned by the API are cached. If the API fails, the
+    last known ID is served for up to stale_if_error seconds before falling
+    back to default_event_id. Pass cache_ttl=0 to always hit the API.
+    """
     if api_base_url:
         base_url = api_base_url.rstrip("/")
     else:
@@ -246,70 +383,82 @@ def get_active_event_id(
             "/"
         )
 
+    cached = _event_id_cache.get(base_url)
+    if cache_ttl > 0 and cached is not None:
+        if time.monotonic() - cached[1] < cache_ttl:
+            return cached[0]
+
+    event_id = _fetch_active_event_id(
+        base_url,
+        timeout=timeout,
+        default_event_id=default_event_id,
+        session=session,
+    )
+
+    if event_id == default_event_id:
+        if cached is not None:
+            age = time.monotonic() - cached[1]
+            if age < stale_if_error:
+                bt.logging.warning(
+                    f"Event ID fetch failed, serving last known event_id "
+                    f"{cached[0]} ({age:.0f}s old)"
+                )
+                return cached[0]
+            _event_id_cache.pop(base_url, None)
+    elif cache_ttl > 0:
+        _event_id_cache[base_url] = (event_id, time.monotonic())
+
+    return event_id
+
+
+def _fetch_active_event_id(
+    base_url: str,
+    *,
+    timeout: float,
+    default_event_id: str,
+    session: Optional[httpx.Client],
+) -> str:
     events_url = f"{base_url}/api/v2/event/events-list"
 
     try:
-        import json
-
-        request_body = {
-            "page": 1,
-            "limit": 20,
-            "sort": {"sortBy": "estimatedEnd", "sortOrder": "desc"},
-            "filter": {"status": ["LIVE"]},
-        }
-
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(
-                events_url,
-                headers={"Content-Type": "application/json"},
-                content=json.dumps(request_body),
-            )
-            response.raise_for_status()
+        client = session or get_shared_session()
+        response = client.post(
+            events_url,
+            headers={"Content-Type": "application/json"},
+            content=_EVENTS_LIST_BODY,
+            timeout=timeout,
+        )
+        response.raise_for_status()
 
-            data = response.json()
+        data = _response_json(response)
 
-            if isinstance(data, list) and len(data) > 0:
-                first_event = data[0]
-                event_id = (
-                    first_event.get("id")
-                    or first_event.get("event_id")
-                    or first_event.get("_id")
-                )
-                if event_id:
-                    bt.logging.info(f"Retrieved active event_id: {event_id}")
-                    return str(event_id)
+        if isinstance(data, list) and len(data) > 0:
+            event_id = _first_present(data[0], _EVENT_ITEM_ID_KEYS)
+            if event_id:
+                bt.logging.info(f"Retrieved active event_id: {event_id}")
+                return str(event_id)
 
-            if isinstance(data, dict):
-                if (
-                    "data" in data
-                    and isinstance(data["data"], list)
-                    and len(data["data"]) > 0
-                ):
-                    first_event = data["data"][0]
-                    event_id = (
-                        first_event.get("id")
-                        or first_event.get("event_id")
-                        or first_event.get("_id")
-                    )
-                    if event_id:
-                        bt.logging.info(f"Retrieved active event_id: {event_id}")
-                        return str(event_id)
-
-                event_id = (
-                    data.get("active_event_id")
-                    or data.get("event_id")
-                    or data.get("id")
-                    or data.get("event")
-                )
+        if isinstance(data, dict):
+            if (
+                "data" in data
+                and isinstance(data["data"], list)
+                and len(data["data"]) > 0
+            ):
+                event_id = _first_present(data["data"][0], _EVENT_ITEM_ID_KEYS)
                 if event_id:
                     bt.logging.info(f"Retrieved active event_id: {event_id}")
                     return str(event_id)
 
-            bt.logging.warning(
-                f"Could not extract event_id from response: {data}. "
-                f"Using default: {default_event_id}"
-            )
-            return default_event_id
+            event_id = _first_present(data, _EVENT_PAYLOAD_ID_KEYS)
+            if event_id:
+                bt.logging.info(f"Retrieved active event_id: {event_id}")
+                return str(event_id)
+
+        bt.logging.warning(
+            f"Could not extract event_id from response: {data}. "
+            f"Using default: {default_event_id}"
+        )
+        return default_event_id
 
     except httpx.TimeoutException as exc:
         bt.logging.warning(
@@ -407,7 +556,18 @@ def get_wahoo_validation_data(
     api_base_url: Optional[str] = None,
     validator_db: Optional[ValidatorDBInterface] = None,
     client: Optional[ValidationAPIClient] = None,
+    session: Optional[httpx.Client] = None,
+    check_reachable: bool = False,
 ) -> List[ValidationRecord]:
+    """
+    Fetch validation records in batches, falling back to the DB cache for
+    any batch the API fails to serve.
+
+    With check_reachable=True a failed batch triggers a liveness probe; if
+    the API is down the remaining batches go straight to the cache instead
+    of each waiting out request timeouts and retries. Healthy runs never
+    probe.
+    """
     if not hotkeys:
         return []
 
@@ -422,7 +582,11 @@ def get_wahoo_validation_data(
     )
 
     if client is None:
-        client = ValidationAPIClient(base_url=endpoint, timeout=batch_timeout)
+        client = ValidationAPIClient(
+            base_url=endpoint,
+            timeout=batch_timeout,
+            session=session or get_shared_session(),
+        )
     else:
         client.base_url = endpoint
         client.timeout = batch_timeout
@@ -437,12 +601,20 @@ def get_wahoo_validation_data(
         f"(max {max_per_batch} per batch, {batch_timeout}s timeout)"
     )
 
+    # Cleared by the liveness probe after a failed batch
+    api_reachable = True
+
     all_records: List[ValidationRecord] = []
     successful_batches = 0
     failed_batches = 0
 
     for batch_num, batch in enumerate(batches, 1):
         try:
+            if not api_reachable:
+                raise ValidationAPIError(
+                    "WAHOO API unreachable (liveness probe failed)"
+                )
+
             records = client.fetch_validation_data(
                 hotkeys=batch,
                 start_date=start_date,
@@ -470,6 +642,9 @@ def get_wahoo_validation_data(
                 "Attempting cache fallback..."
             )
 
+            if check_reachable and api_reachable:
+                api_reachable = is_api_reachable(endpoint, session=session)
+
             if validator_db is not None:
                 try:
                     cached_data = validator_db.get_cached_validation_data(
@@ -49,8 +49,8 @@ def should_skip_weight_computation(
             )
         return True
 
-    usable_records = filter_usable_records(validation_data)
-    if len(usable_records) == 0:
+    # Stop at the first usable record; the client already filtered the list
+    if not any(has_usable_metrics(r) for r in validation_data):
         if log_reason:
             logger.warning(
                 f"All {len(validation_data)} validation record(s) have empty metrics. "
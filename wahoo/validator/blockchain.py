@@ -1,6 +1,10 @@
 import logging
+import traceback
 from typing import List, Optional, Tuple, Any
 
+import numpy as np
+import torch
+
 from .api import SET_WEIGHTS_MAX_RETRIES
 
 logger = logging.getLogger(__name__)
@@ -18,18 +22,20 @@ def set_weights_with_retry(
     *,
     max_retries: int = SET_WEIGHTS_MAX_RETRIES,
     commit_period: int = 32,  # Default Bittensor commit period in blocks
+    block: Optional[int] = None,
 ) -> Tuple[Optional[str], bool]:
     global _last_successful_block, _last_cooldown_log_block
     max_attempts = max_retries + 1
     attempt = 0
 
-    # Get current block number
-    current_block = None
-    try:
-        if hasattr(subtensor, "block"):
-            current_block = subtensor.block
-    except Exception:
-        pass
+    # Get current block number (callers that already know it pass block=)
+    current_block = block
+    if current_block is None:
+        try:
+            if hasattr(subtensor, "block"):
+                current_block = subtensor.block
+        except Exception:
+            pass
 
     while attempt < max_attempts:
         attempt += 1
@@ -42,9 +48,6 @@ def set_weights_with_retry(
 
         try:
             # Convert weights to proper format (numpy array or list) if it's a torch tensor
-            import torch
-            import numpy as np
-            
             if isinstance(weights, torch.Tensor):
                 weights = weights.detach().cpu().numpy()
             elif not isinstance(weights, (list, np.ndarray)):
@@ -71,16 +74,6 @@ def set_weights_with_retry(
             # Log the result type for debugging
             logger.debug(f"set_weights() returned type: {type(result)}")
             
-            # Check for cooldown message in debug logs or response
-            # Sometimes bittensor returns empty ExtrinsicResponse when "too soon"
-            # but logs the actual message to debug
-            import logging as std_logging
-            bittensor_logger = std_logging.getLogger('bittensor')
-            if hasattr(bittensor_logger, 'handlers'):
-                # Check if there's a "too soon" message in recent logs
-                # This is a workaround for bittensor 10.0.0 not populating error field
-                pass
-
             # Handle ExtrinsicResponse objects (bittensor >= 10.0.0)
             if hasattr(result, 'success') and hasattr(result, 'message'):
                 # This is an ExtrinsicResponse object
@@ -324,7 +317,6 @@ def set_weights_with_retry(
             failure_reason = str(exc)
             
             # Log full traceback for debugging
-            import traceback
             logger.debug(
                 f"set_weights() exception traceback:\n{traceback.format_exc()}"
             )
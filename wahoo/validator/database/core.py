@@ -1,9 +1,11 @@
 import logging
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from ..api.client import ValidatorDBInterface
 from .validator_db import get_or_create_database
@@ -19,11 +21,70 @@ DEFAULT_SCORING_RETENTION_DAYS = int(os.getenv("VALIDATOR_SCORING_RETENTION_DAYS
 class ValidatorDB(ValidatorDBInterface):
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path
-        get_or_create_database(self.db_path)
+        self._local = threading.local()
+        get_or_create_database(self.db_path).close()
 
     def _get_conn(self) -> sqlite3.Connection:
+        tx_conn = getattr(self._local, "tx_conn", None)
+        if tx_conn is not None:
+            return tx_conn
         return get_or_create_database(self.db_path)
 
+    def _in_transaction(self, conn: sqlite3.Connection) -> bool:
+        return conn is getattr(self._local, "tx_conn", None)
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        if not self._in_transaction(conn):
+            conn.commit()
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if not self._in_transaction(conn):
+            conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Optional[sqlite3.Connection]]:
+        """
+        Group several writes into a single SQLite transaction.
+
+        Methods called from the same thread inside the block share one
+        connection and defer their commits to the end of the block, so the
+        whole group costs one commit (and fsync) instead of one per call.
+        Nested use joins the outer transaction. If the transaction cannot be
+        started, the block still runs and each write commits on its own.
+        """
+        tx_conn = getattr(self._local, "tx_conn", None)
+        if tx_conn is not None:
+            yield tx_conn
+            return
+
+        conn = None
+        try:
+            conn = get_or_create_database(self.db_path)
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            logger.warning(
+                f"Failed to begin transaction, writes will commit individually: {e}"
+            )
+            if conn is not None:
+                conn.close()
+            yield None
+            return
+
+        self._local.tx_conn = conn
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            try:
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to commit transaction: {e}")
+        finally:
+            self._local.tx_conn = None
+            conn.close()
+
     def cache_validation_data(self, hotkey: str, data_dict: Dict[str, Any]) -> None:
         try:
             conn = self._get_conn()
@@ -69,8 +130,8 @@ class ValidatorDB(ValidatorDBInterface):
                 (hotkey, timestamp),
             )
 
-            conn.commit()
-            conn.close()
+            self._commit(conn)
+            self._release(conn)
         except Exception as e:
             logger.error(f"Failed to cache validation data for {hotkey}: {e}")
 
@@ -108,7 +169,7 @@ class ValidatorDB(ValidatorDBInterface):
             params = list(hotkeys) + [cutoff_date]
             cursor.execute(query, params)
             rows = cursor.fetchall()
-            conn.close()
+            self._release(conn)
 
             results = []
             for row in rows:
@@ -151,8 +212,8 @@ class ValidatorDB(ValidatorDBInterface):
                 f"DELETE FROM performance_snapshots WHERE hotkey IN ({placeholders})",
                 list(hotkeys),
             )
-            conn.commit()
-            conn.close()
+            self._commit(conn)
+            self._release(conn)
         except Exception as e:
             logger.error(f"Failed to delete cached data: {e}")
 
@@ -200,13 +261,15 @@ class ValidatorDB(ValidatorDBInterface):
             )
             result["scoring_runs_deleted"] = cursor.rowcount
 
-            conn.commit()
+            self._commit(conn)
 
-            if result["snapshots_deleted"] > 0 or result["scoring_runs_deleted"] > 0:
+            if (
+                result["snapshots_deleted"] > 0 or result["scoring_runs_deleted"] > 0
+            ) and not self._in_transaction(conn):
                 conn.execute("VACUUM")
                 conn.commit()
 
-            conn.close()
+            self._release(conn)
 
             return result
         except Exception as e:
@@ -234,8 +297,8 @@ class ValidatorDB(ValidatorDBInterface):
                 data,
             )
 
-            conn.commit()
-            conn.close()
+            self._commit(conn)
+            self._release(conn)
         except Exception as e:
             logger.error(f"Failed to save scoring run: {e}")
 
@@ -256,7 +319,7 @@ class ValidatorDB(ValidatorDBInterface):
 
             cursor.execute(query)
             rows = cursor.fetchall()
-            conn.close()
+            self._release(conn)
 
             return {row[0]: row[1] for row in rows}
         except Exception as e:
@@ -294,8 +357,8 @@ class ValidatorDB(ValidatorDBInterface):
                         (uid, hotkey),
                     )
             
-            conn.commit()
-            conn.close()
+            self._commit(conn)
+            self._release(conn)
         except Exception as e:
             logger.error(f"Failed to sync miner metadata: {e}")
 
@@ -317,7 +380,7 @@ class ValidatorDB(ValidatorDBInterface):
             unregistered_hotkeys = db_hotkeys - registered_set
 
             if not unregistered_hotkeys:
-                conn.close()
+                self._release(conn)
                 return 0
 
             # Delete from related tables (order matters due to foreign key constraints)
@@ -349,8 +412,8 @@ class ValidatorDB(ValidatorDBInterface):
             )
             miners_deleted = cursor.rowcount
 
-            conn.commit()
-            conn.close()
+            self._commit(conn)
+            self._release(conn)
 
             logger.info(
                 f"Removed {miners_deleted} unregistered miners from database: "
@@ -385,7 +448,7 @@ class ValidatorDB(ValidatorDBInterface):
             CREATE INDEX IF NOT EXISTS idx_user_hotkey_bindings_hotkey
             ON user_hotkey_bindings(hotkey)
         """)
-        conn.commit()
+        self._commit(conn)
 
     def get_binding_for_hotkey(self, hotkey: str) -> Optional[Dict[str, Any]]:
         try:
@@ -399,7 +462,7 @@ class ValidatorDB(ValidatorDBInterface):
                 (hotkey,)
             )
             row = cursor.fetchone()
-            conn.close()
+            self._release(conn)
             
             if row:
                 return dict(row)
@@ -438,8 +501,8 @@ class ValidatorDB(ValidatorDBInterface):
                     """,
                     (user_id, hotkey, now_str, now_str)
                 )
-                conn.commit()
-                conn.close()
+                self._commit(conn)
+                self._release(conn)
                 
                 if user_id:
                     logger.debug(
@@ -460,8 +523,8 @@ class ValidatorDB(ValidatorDBInterface):
                     "UPDATE user_hotkey_bindings SET last_updated_at = ? WHERE hotkey = ?",
                     (now_str, hotkey)
                 )
-                conn.commit()
-                conn.close()
+                self._commit(conn)
+                self._release(conn)
                 return None, False  # No change
             
             # userId has changed - update binding and record previous
@@ -473,8 +536,8 @@ class ValidatorDB(ValidatorDBInterface):
                 """,
                 (user_id, now_str, existing_user_id, hotkey)
             )
-            conn.commit()
-            conn.close()
+            self._commit(conn)
+            self._release(conn)
             
             # Return the previous userId (only if it was non-None)
             return existing_user_id, False
@@ -90,6 +90,10 @@ def get_or_create_database(db_path: Optional[Path] = None) -> sqlite3.Connection
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(str(db_path))
+    # synchronous is per-connection, so schema.sql only covered the connection
+    # that created the file; WAL also covers databases created by migrations
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
 
     cursor = conn.cursor()
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
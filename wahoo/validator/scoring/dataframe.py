@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Sequence
+from operator import attrgetter
+from typing import Dict, Iterable, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from .models import PerformanceMetrics, ValidationRecord
@@ -87,6 +89,38 @@ def records_to_dataframe(
     return df.reset_index(drop=True)
 
 
+_GET_HOTKEY = attrgetter("hotkey")
+_GET_PERFORMANCE = attrgetter("performance")
+
+
+def records_to_soa(
+    records: Sequence[ValidationRecord],
+    columns: Optional[Sequence[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Flatten records into contiguous column arrays, skipping the DataFrame.
+
+    Mirrors records_to_dataframe() defaults: one row per hotkey (the last
+    record wins), rows sorted by hotkey, missing numeric values filled with 0.
+    Only the requested numeric columns are built (default: all of them).
+    """
+    # dict() keeps the last record per hotkey; attrgetter does lookups in C
+    latest: Dict[str, ValidationRecord] = dict(zip(map(_GET_HOTKEY, records), records))
+
+    hotkeys = sorted(latest)
+    perfs = list(map(_GET_PERFORMANCE, map(latest.__getitem__, hotkeys)))
+    count = len(perfs)
+
+    result: Dict[str, np.ndarray] = {"hotkey": np.array(hotkeys, dtype=object)}
+    for column in columns or FLOAT_COLUMNS + INT_COLUMNS:
+        dtype = np.int64 if column in INT_COLUMNS else np.float64
+        get_value = attrgetter(column)
+        result[column] = np.fromiter(
+            (get_value(perf) or 0 for perf in perfs), dtype=dtype, count=count
+        )
+    return result
+
+
 def ensure_required_columns(
     df: pd.DataFrame, required: Iterable[str] | None = None
 ) -> None:
@@ -107,4 +141,9 @@ def ensure_required_columns(
         raise ValueError(f"DataFrame missing required columns: {missing}")
 
 
-__all__ = ["records_to_dataframe", "ensure_required_columns", "flatten_record"]
+__all__ = [
+    "records_to_dataframe",
+    "records_to_soa",
+    "ensure_required_columns",
+    "flatten_record",
+]
@@ -1,6 +1,8 @@
 import logging
 from typing import Dict, Optional
 
+from .validation import validate_ema_scores
+
 logger = logging.getLogger(__name__)
 
 
@@ -10,8 +12,6 @@ def get_fallback_weights_from_db(validator_db) -> Optional[Dict[str, float]]:
         return None
 
     try:
-        from .validation import validate_ema_scores
-
         fallback_scores = validator_db.get_latest_scores()
         if not fallback_scores:
             logger.warning("No scores in DB for fallback")
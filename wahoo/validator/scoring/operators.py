@@ -1,6 +1,7 @@
 from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Sequence
 
@@ -9,6 +10,13 @@ import pandas as pd
 
 from .dataframe import ensure_required_columns
 
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
 HALF_LIFE_SECONDS = 12 * 3600
@@ -21,6 +29,53 @@ CLIFF_RESET_THRESHOLD = 0.5
 NEW_MINER_HIGH_SCORE_THRESHOLD = 5000
 HIGH_PROFIT_THRESHOLD = 50000
 
+# Per-miner branch taken by the EMA update
+EMA_BRANCH_NEW = 0
+EMA_BRANCH_CLIFF = 1
+EMA_BRANCH_SMOOTH = 2
+
+
+def _ema_update_numpy(
+    raw: np.ndarray, prev: np.ndarray, alpha: float, cliff_threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    new = prev == 0.0
+    cliff = ~new & (prev > 0.0) & (raw < cliff_threshold * prev)
+    smoothed = np.where(new | cliff, raw, (1.0 - alpha) * prev + alpha * raw)
+    branch = np.full(raw.shape[0], EMA_BRANCH_SMOOTH, dtype=np.int8)
+    branch[new] = EMA_BRANCH_NEW
+    branch[cliff] = EMA_BRANCH_CLIFF
+    return smoothed, branch
+
+
+if HAS_NUMBA:
+
+    # Explicit signature compiles (or loads from cache) at import time, so the
+    # first scoring pass doesn't pay the JIT cost
+    @njit(
+        "Tuple((float64[::1], int8[::1]))(float64[::1], float64[::1], float64, float64)",
+        cache=True,
+    )
+    def _ema_update_kernel(raw, prev, alpha, cliff_threshold):
+        n = raw.shape[0]
+        smoothed = np.empty(n, dtype=np.float64)
+        branch = np.empty(n, dtype=np.int8)
+        for i in range(n):
+            p = prev[i]
+            r = raw[i]
+            if p == 0.0:
+                smoothed[i] = r
+                branch[i] = EMA_BRANCH_NEW
+            elif p > 0.0 and r < cliff_threshold * p:
+                smoothed[i] = r
+                branch[i] = EMA_BRANCH_CLIFF
+            else:
+                smoothed[i] = (1.0 - alpha) * p + alpha * r
+                branch[i] = EMA_BRANCH_SMOOTH
+        return smoothed, branch
+
+else:
+    _ema_update_kernel = _ema_update_numpy
+
 
 @dataclass(frozen=True)
 class OperatorResult:
@@ -28,6 +83,40 @@ class OperatorResult:
     meta: Dict[str, Any]
 
 
+class EMAState(Mapping):
+    """
+    Read-only hotkey -> EMA score mapping stored as parallel arrays.
+
+    Scores stay in one contiguous float64 array aligned with ``hotkeys``, and
+    lookups go through a hotkey -> row index built once, instead of boxing
+    every score into a per-hotkey dict entry.
+    """
+
+    __slots__ = ("hotkeys", "scores", "index")
+
+    def __init__(self, hotkeys: np.ndarray, scores: np.ndarray):
+        self.hotkeys = np.asarray(hotkeys, dtype=object)
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.index: Dict[str, int] = {
+            str(hotkey): i for i, hotkey in enumerate(self.hotkeys.tolist())
+        }
+
+    def __getitem__(self, hotkey: str) -> float:
+        return float(self.scores[self.index[hotkey]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return f"EMAState({len(self)} hotkeys)"
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(zip(self.index, self.scores[list(self.index.values())].tolist()))
+
+
 class Operator(ABC):
     name: str = "base"
     required_columns: Sequence[str] = (
@@ -61,60 +150,77 @@ class EMAVolumeScorer(Operator):
         previous_scores: Optional[Dict[str, float]] = None,
     ) -> OperatorResult:
         df = self.preprocess(df)
+        return self.run_arrays(
+            df["hotkey"].to_numpy(),
+            df["profit"].fillna(0).to_numpy(dtype=float),
+            previous_scores=previous_scores,
+        )
 
+    def run_arrays(
+        self,
+        hotkeys: np.ndarray,
+        profit: np.ndarray,
+        previous_scores: Optional[Dict[str, float]] = None,
+    ) -> OperatorResult:
+        """Score row-aligned hotkey/profit arrays without going through pandas."""
         if previous_scores is None:
             previous_scores = {}
 
-        hotkeys = df["hotkey"].to_numpy()
-        profit = df["profit"].fillna(0).to_numpy(dtype=float)
+        profit = np.asarray(profit, dtype=np.float64)
 
         # Only positive profit contributes to score; losses are clipped to 0
         clamped_profit = np.maximum(0.0, profit)
         raw_scores = np.power(clamped_profit, self.profit_exp)
 
-        smoothed_scores = np.zeros_like(raw_scores)
-        new_miner_count = 0
-        cliff_reset_count = 0
-
-        for i, hotkey in enumerate(hotkeys):
-            prev_score = previous_scores.get(hotkey, 0.0)
-            raw = raw_scores[i]
-            p = profit[i]
-
-            if prev_score == 0.0:
-                smoothed_scores[i] = raw
-                new_miner_count += 1
-
-                if raw > NEW_MINER_HIGH_SCORE_THRESHOLD:
-                    logger.warning(
-                        f"ANOMALY: New miner {hotkey[:16]}... has unusually high raw score: "
-                        f"raw_score={raw:.2f}, profit=${p:.2f}"
-                    )
-                elif p > HIGH_PROFIT_THRESHOLD:
-                    logger.info(
-                        f"New high-profit miner {hotkey[:16]}...: "
-                        f"raw_score={raw:.2f}, profit=${p:.2f}"
-                    )
-            elif prev_score > 0 and raw < CLIFF_RESET_THRESHOLD * prev_score:
-                smoothed_scores[i] = raw
-                cliff_reset_count += 1
-                logger.warning(
-                    f"EMA cliff reset for {hotkey[:16]}...: "
-                    f"prev_ema={prev_score:.2f}, raw={raw:.4f}, "
-                    f"ratio={raw/prev_score:.6f} < {CLIFF_RESET_THRESHOLD}, "
-                    f"profit=${p:.2f}"
-                )
-            else:
-                smoothed_scores[i] = (
-                    1 - self.alpha
-                ) * prev_score + self.alpha * raw
+        prev_scores = np.fromiter(
+            (previous_scores.get(hotkey, 0.0) for hotkey in hotkeys),
+            dtype=np.float64,
+            count=len(hotkeys),
+        )
+        smoothed_scores, branch = _ema_update_kernel(
+            np.ascontiguousarray(raw_scores, dtype=np.float64),
+            prev_scores,
+            float(self.alpha),
+            float(CLIFF_RESET_THRESHOLD),
+        )
+
+        is_new = branch == EMA_BRANCH_NEW
+        is_cliff = branch == EMA_BRANCH_CLIFF
+        new_miner_count = int(is_new.sum())
+        cliff_reset_count = int(is_cliff.sum())
 
-                if prev_score > 0 and raw < 0.1 * prev_score:
-                    logger.info(
-                        f"Significant score drop for {hotkey[:16]}...: "
-                        f"prev_ema={prev_score:.2f}, raw={raw:.2f}, "
-                        f"ratio={raw/prev_score:.4f}, profit=${p:.2f}"
-                    )
+        # Per-miner diagnostics only for the (rare) rows that need them
+        high_new = is_new & (raw_scores > NEW_MINER_HIGH_SCORE_THRESHOLD)
+        for i in np.flatnonzero(high_new):
+            logger.warning(
+                f"ANOMALY: New miner {hotkeys[i][:16]}... has unusually high raw score: "
+                f"raw_score={raw_scores[i]:.2f}, profit=${profit[i]:.2f}"
+            )
+        for i in np.flatnonzero(is_new & ~high_new & (profit > HIGH_PROFIT_THRESHOLD)):
+            logger.info(
+                f"New high-profit miner {hotkeys[i][:16]}...: "
+                f"raw_score={raw_scores[i]:.2f}, profit=${profit[i]:.2f}"
+            )
+        for i in np.flatnonzero(is_cliff):
+            raw, prev_score = raw_scores[i], prev_scores[i]
+            logger.warning(
+                f"EMA cliff reset for {hotkeys[i][:16]}...: "
+                f"prev_ema={prev_score:.2f}, raw={raw:.4f}, "
+                f"ratio={raw/prev_score:.6f} < {CLIFF_RESET_THRESHOLD}, "
+                f"profit=${profit[i]:.2f}"
+            )
+        significant_drop = (
+            (branch == EMA_BRANCH_SMOOTH)
+            & (prev_scores > 0)
+            & (raw_scores < 0.1 * prev_scores)
+        )
+        for i in np.flatnonzero(significant_drop):
+            raw, prev_score = raw_scores[i], prev_scores[i]
+            logger.info(
+                f"Significant score drop for {hotkeys[i][:16]}...: "
+                f"prev_ema={prev_score:.2f}, raw={raw:.2f}, "
+                f"ratio={raw/prev_score:.4f}, profit=${profit[i]:.2f}"
+            )
 
         if cliff_reset_count > 0:
             logger.info(
@@ -140,10 +246,7 @@ class EMAVolumeScorer(Operator):
             "cliff_threshold": CLIFF_RESET_THRESHOLD,
             "max_weight": float(weights.max()) if len(weights) > 0 else 0.0,
             "mean_weight": float(weights.mean()) if len(weights) > 0 else 0.0,
-            "smoothed_scores": {
-                str(hotkey): float(smoothed_scores[i])
-                for i, hotkey in enumerate(hotkeys)
-            },
+            "smoothed_scores": EMAState(hotkeys, smoothed_scores),
         }
 
         return OperatorResult(weights=weights, meta=meta)
@@ -152,6 +255,7 @@ class EMAVolumeScorer(Operator):
 __all__ = [
     "Operator",
     "OperatorResult",
+    "EMAState",
     "EMAVolumeScorer",
     "EMA_ALPHA",
     "HALF_LIFE_EPOCHS",
@@ -1,8 +1,9 @@
 import logging
 import math
 import os
+import numpy as np
 import torch
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 
 from ..utils.miners import build_uid_to_hotkey, is_valid_hotkey
 from .models import ValidationRecord
@@ -138,7 +139,7 @@ def _get_hotkey_from_uid(
 
 
 def reward(
-    responses: List[Any],
+    responses: Union[List[Any], np.ndarray],
     uids: List[int],
     metagraph: Any,
     wahoo_weights: Optional[Dict[str, float]] = None,
@@ -159,7 +160,8 @@ def reward(
         logger.debug("Building uid_to_hotkey mapping from metagraph")
         uid_to_hotkey = build_uid_to_hotkey(metagraph, active_uids=uids)
 
-    rewards_dict: Dict[int, float] = {}
+    # Filled in place by position; uids are unique so this matches a uid-keyed dict
+    rewards_arr = np.zeros(len(uids), dtype=np.float32)
 
     if wahoo_weights is None:
         wahoo_weights = {}
@@ -170,75 +172,60 @@ def reward(
             if isinstance(record, ValidationRecord):
                 validation_by_hotkey[record.hotkey] = record
 
+    # Validate every response once up front; the loop only reads the mask
+    valid_responses = np.fromiter(
+        (_validate_response(response) for response in responses),
+        dtype=bool,
+        count=len(responses),
+    )
+
     for idx, uid in enumerate(uids):
-        response = responses[idx] if idx < len(responses) else None
         hotkey = _get_hotkey_from_uid(uid, metagraph, uid_to_hotkey)
 
         if hotkey is None or not is_valid_hotkey(hotkey):
             logger.warning(
                 f"UID {uid}: missing or invalid hotkey. Setting weight to 0.0"
             )
-            rewards_dict[uid] = 0.0
+            rewards_arr[idx] = 0.0
             continue
 
+        # Check thresholds once per UID; every branch below reuses the result
+        validation_record = validation_by_hotkey.get(hotkey)
+        if validation_record is not None:
+            passes, reason = _check_thresholds(validation_record)
+            if not passes:
+                logger.warning(
+                    f"UID {uid} (hotkey={hotkey}): "
+                    f"failing thresholds - {reason}. Setting weight to 0.0"
+                )
+                rewards_arr[idx] = 0.0
+                continue
+
         if hotkey in wahoo_weights:
-            weight = wahoo_weights[hotkey]
             try:
-                weight_float = float(weight)
+                weight_float = float(wahoo_weights[hotkey])
                 if weight_float >= 0.0:
-                    validation_record = validation_by_hotkey.get(hotkey)
-                    if validation_record:
-                        passes, reason = _check_thresholds(validation_record)
-                        if not passes:
-                            logger.warning(
-                                f"UID {uid} (hotkey={hotkey}): "
-                                f"failing thresholds - {reason}. Setting weight to 0.0"
-                            )
-                            rewards_dict[uid] = 0.0
-                        else:
-                            rewards_dict[uid] = weight_float
-                    else:
-                        rewards_dict[uid] = weight_float
+                    rewards_arr[idx] = weight_float
                     continue
             except (ValueError, TypeError):
                 pass
 
-        if _validate_response(response):
-            validation_record = validation_by_hotkey.get(hotkey)
-            if validation_record:
-                passes, reason = _check_thresholds(validation_record)
-                if not passes:
-                    logger.warning(
-                        f"UID {uid} (hotkey={hotkey}): "
-                        f"failing thresholds - {reason}. Setting weight to 0.0"
-                    )
-                    rewards_dict[uid] = 0.0
-                else:
-                    rewards_dict[uid] = 1.0
-            else:
-                rewards_dict[uid] = 1.0
+        if valid_responses[idx]:
+            rewards_arr[idx] = 1.0
         else:
-            validation_record = validation_by_hotkey.get(hotkey)
-            if validation_record:
-                passes, reason = _check_thresholds(validation_record)
-                if not passes:
-                    logger.warning(
-                        f"UID {uid} (hotkey={hotkey}): "
-                        f"failing thresholds - {reason}. Setting weight to 0.0"
-                    )
-                else:
-                    logger.debug(
-                        f"UID {uid} (hotkey={hotkey}): "
-                        "invalid response. Setting weight to 0.0"
-                    )
+            if validation_record is not None:
+                logger.debug(
+                    f"UID {uid} (hotkey={hotkey}): "
+                    "invalid response. Setting weight to 0.0"
+                )
             else:
                 logger.debug(
                     f"UID {uid} (hotkey={hotkey}): "
                     "missing validation data and invalid response. Setting weight to 0.0"
                 )
-            rewards_dict[uid] = 0.0
+            rewards_arr[idx] = 0.0
 
-    rewards = torch.FloatTensor([rewards_dict.get(uid, 0.0) for uid in uids])
+    rewards = torch.from_numpy(rewards_arr)
 
     total = rewards.sum()
     if total > 0.0:
@@ -246,22 +233,21 @@ def reward(
         # This implements the burn mechanism: only MINER_EMISSION_PERCENTAGE goes to miners
         # The remaining BURN_RATE will be routed to owner UID 176
         rewards = rewards / total * MINER_EMISSION_PERCENTAGE
+        rewards_sum = rewards.sum().item()
         logger.info(
             f"Applied {MINER_EMISSION_PERCENTAGE*100:.1f}% miner emissions "
             f"(burn_rate: {BURN_RATE*100:.1f}% will route to owner UID {OWNER_UID}). "
-            f"Total weight sum: {rewards.sum().item():.6f}"
+            f"Total weight sum: {rewards_sum:.6f}"
         )
     else:
         if USE_EQUAL_WEIGHTS_FALLBACK:
-            valid_count = sum(1 for uid in uids if rewards_dict.get(uid, 0.0) > 0.0)
+            positive = rewards_arr > 0.0
+            valid_count = int(positive.sum())
             if valid_count > 0:
                 # Apply burn rate to equal weights as well
                 equal_weight = (1.0 / valid_count) * MINER_EMISSION_PERCENTAGE
-                rewards = torch.FloatTensor(
-                    [
-                        equal_weight if rewards_dict.get(uid, 0.0) > 0.0 else 0.0
-                        for uid in uids
-                    ]
+                rewards = torch.from_numpy(
+                    np.where(positive, equal_weight, 0.0).astype(np.float32)
                 )
                 logger.info(
                     f"All WAHOO weights zero, using equal weights fallback: "
@@ -272,27 +258,25 @@ def reward(
                 rewards = torch.zeros(len(uids), dtype=torch.float32)
         else:
             rewards = torch.zeros(len(uids), dtype=torch.float32)
+        rewards_sum = rewards.sum().item()
 
     assert rewards.shape == (
         len(uids),
     ), f"Rewards shape mismatch: expected ({len(uids)},), got {rewards.shape}"
 
     if total > 0.0:
-        sum_after_norm = rewards.sum().item()
         epsilon = 1e-6
         expected_sum = MINER_EMISSION_PERCENTAGE
-        if abs(sum_after_norm - expected_sum) >= epsilon:
+        if abs(rewards_sum - expected_sum) >= epsilon:
             logger.warning(
-                f"Normalization invariant violation: rewards.sum() = {sum_after_norm}, "
+                f"Normalization invariant violation: rewards.sum() = {rewards_sum}, "
                 f"expected {expected_sum} (tolerance: {epsilon})"
             )
 
-    if total > 0.0 and rewards.sum().item() > 0.0:
-        pass
-    else:
+    if not (total > 0.0 and rewards_sum > 0.0):
         logger.debug(
             "Skipping set_weights() call: all rewards are zero "
-            f"(total={total}, rewards.sum()={rewards.sum().item()})"
+            f"(total={total}, rewards.sum()={rewards_sum})"
         )
 
     return rewards
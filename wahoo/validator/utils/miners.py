@@ -1,5 +1,8 @@
 import logging
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +129,181 @@ def build_uid_to_hotkey(
         return {}
 
 
+@dataclass
+class ActiveView:
+    active_uids: List[int] = field(default_factory=list)
+    uid_to_hotkey: Dict[int, str] = field(default_factory=dict)
+    hotkeys: List[str] = field(default_factory=list)
+    hotkey_to_uid: Dict[str, int] = field(default_factory=dict)
+    hotkey_to_axon_ip: Dict[str, str] = field(default_factory=dict)
+
+
+def _filter_miner_uids(all_uids: List[Any], validator_permit: Any) -> List[int]:
+    """
+    Drop UIDs holding a validator permit, using one NumPy mask when the
+    metagraph arrays convert cleanly and a per-UID check otherwise, so one bad
+    entry only excludes that UID.
+    """
+    try:
+        uids = np.asarray(all_uids, dtype=np.int64).reshape(-1)
+        permit = np.asarray(validator_permit, dtype=bool).reshape(-1)
+    except (ValueError, TypeError) as e:
+        logger.debug(f"Falling back to per-UID validator_permit check: {e}")
+        return _filter_miner_uids_per_uid(all_uids, validator_permit)
+
+    in_range = (uids >= 0) & (uids < permit.shape[0])
+    for uid in uids[~in_range].tolist():
+        logger.error(f"Error checking validator_permit for UID {uid}: out of range")
+    is_miner = np.zeros(uids.shape[0], dtype=bool)
+    is_miner[in_range] = ~permit[uids[in_range]]
+    return uids[is_miner].tolist()
+
+
+def _filter_miner_uids_per_uid(
+    all_uids: List[Any], validator_permit: Any
+) -> List[int]:
+    miner_uids: List[int] = []
+    for uid in all_uids:
+        try:
+            uid = int(uid)
+            is_validator = validator_permit[uid]
+            if hasattr(is_validator, "item"):
+                is_validator = bool(is_validator.item())
+            else:
+                is_validator = bool(is_validator)
+            if not is_validator:
+                miner_uids.append(uid)
+        except (IndexError, AttributeError, TypeError, ValueError) as e:
+            logger.error(f"Error checking validator_permit for UID {uid}: {e}")
+    return miner_uids
+
+
+def build_active_view(metagraph: Any) -> ActiveView:
+    """
+    Collect active miner UIDs and their hotkey mappings in a single pass.
+
+    Equivalent to get_active_uids() followed by build_uid_to_hotkey() and the
+    hotkey list / reverse mapping built from it, but filters validators with
+    one NumPy mask and walks only the remaining miners once.
+    UIDs with a missing or invalid hotkey stay in active_uids but are left out
+    of the hotkey mappings. Axon IPs are collected in the same pass when the
+    metagraph exposes axons. A malformed entry only drops its own UID, as in
+    the per-UID helpers.
+    """
+    view = ActiveView()
+
+    try:
+        if hasattr(metagraph, "uids") and metagraph.uids is not None:
+            all_uids = list(metagraph.uids)
+        elif hasattr(metagraph, "hotkeys") and metagraph.hotkeys is not None:
+            all_uids = list(range(len(metagraph.hotkeys)))
+        else:
+            logger.warning("Metagraph does not have 'uids' or 'hotkeys' attribute")
+            return view
+
+        validator_permit = getattr(metagraph, "validator_permit", None)
+        if validator_permit is None:
+            logger.warning("Metagraph does not have 'validator_permit' attribute, returning all UIDs")
+
+        metagraph_hotkeys = getattr(metagraph, "hotkeys", None)
+        if metagraph_hotkeys is None:
+            logger.warning("Metagraph does not have 'hotkeys' attribute")
+        num_hotkeys = len(metagraph_hotkeys) if metagraph_hotkeys is not None else 0
+
+        axons = getattr(metagraph, "axons", None)
+        num_axons = len(axons) if axons is not None else 0
+
+        if validator_permit is not None:
+            view.active_uids = _filter_miner_uids(all_uids, validator_permit)
+        else:
+            view.active_uids = [int(uid) for uid in all_uids]
+
+        for uid in view.active_uids:
+            try:
+                if uid < 0 or uid >= num_hotkeys:
+                    logger.debug(f"UID {uid} out of bounds for metagraph.hotkeys")
+                    continue
+
+                hotkey = metagraph_hotkeys[uid]
+                if not is_valid_hotkey(hotkey):
+                    logger.warning(
+                        f"UID {uid} has invalid/malformed hotkey: {hotkey}. "
+                        "Will be excluded from mapping."
+                    )
+                    continue
+
+                hotkey = str(hotkey).strip()
+            except (IndexError, AttributeError, TypeError) as e:
+                logger.warning(f"Error processing UID {uid} for hotkey mapping: {e}")
+                continue
+
+            view.uid_to_hotkey[uid] = hotkey
+            view.hotkeys.append(hotkey)
+            view.hotkey_to_uid[hotkey] = uid
+
+            try:
+                if uid < num_axons and axons[uid] is not None:
+                    ip = getattr(axons[uid], "ip", None)
+                    if ip is not None:
+                        view.hotkey_to_axon_ip[hotkey] = str(ip)
+            except (IndexError, AttributeError):
+                pass
+
+        logger.info(
+            f"Found {len(all_uids)} total registered UIDs: "
+            f"{len(view.active_uids)} miners, "
+            f"{len(all_uids) - len(view.active_uids)} validators; "
+            f"{len(view.uid_to_hotkey)} valid hotkey mappings"
+        )
+        return view
+
+    except Exception as e:
+        logger.error(f"Error building active view from metagraph: {e}")
+        return ActiveView()
+
+
+# Most recent (block, hotkeys) key and the view built for it
+_active_view_cache: Optional[Tuple[Tuple[int, Tuple[str, ...]], ActiveView]] = None
+
+
+def _metagraph_cache_key(metagraph: Any) -> Optional[Tuple[int, Tuple[str, ...]]]:
+    block = getattr(metagraph, "block", None)
+    hotkeys = getattr(metagraph, "hotkeys", None)
+    if block is None or hotkeys is None:
+        return None
+    try:
+        block = int(block.item()) if hasattr(block, "item") else int(block)
+        return block, tuple(hotkeys)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_active_view(metagraph: Any) -> ActiveView:
+    """
+    Return build_active_view(metagraph), reusing the previous result while the
+    metagraph block and hotkeys are unchanged.
+
+    The returned view is shared between calls; treat it as read-only.
+    """
+    global _active_view_cache
+
+    key = _metagraph_cache_key(metagraph)
+    if key is not None and _active_view_cache is not None:
+        cached_key, cached_view = _active_view_cache
+        if cached_key == key:
+            logger.debug(f"Reusing active view for block {key[0]}")
+            return cached_view
+
+    view = build_active_view(metagraph)
+    if key is not None and view.active_uids:
+        _active_view_cache = (key, view)
+    return view
+
+
 __all__ = [
+    "ActiveView",
+    "build_active_view",
+    "get_active_view",
     "get_active_uids",
     "is_valid_hotkey",
     "build_uid_to_hotkey",
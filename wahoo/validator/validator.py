@@ -1,11 +1,16 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 
 import bittensor as bt
-import torch
+import numpy as np
 from dotenv import load_dotenv
 
 from .api import (
@@ -14,8 +19,17 @@ from .api import (
     should_skip_weight_computation,
 )
 from .blockchain import set_weights_with_retry
-from .scoring.rewards import reward, OWNER_UID, MINER_EMISSION_PERCENTAGE, BURN_RATE
-from .utils.miners import build_uid_to_hotkey, get_active_uids
+from .scoring.dataframe import records_to_dataframe, records_to_soa
+from .scoring.fallback import get_fallback_weights_from_db
+from .scoring.operators import EMAVolumeScorer
+from .scoring.rewards import (
+    reward,
+    OWNER_UID,
+    MINER_EMISSION_PERCENTAGE,
+    BURN_RATE,
+)
+from .scoring.validation import validate_ema_scores
+from .utils.miners import get_active_view
 
 load_dotenv()
 
@@ -29,6 +43,48 @@ WAHOO_VALIDATION_ENDPOINT = (
 
 BLOCK_TIME_SECONDS = 12.0
 
+# Resync the metagraph only once the chain is this many blocks ahead of it
+DEFAULT_SYNC_BLOCK_DELTA = 1
+
+# Shared pool for network-bound calls that can overlap within an iteration
+# Each iteration submits at most three tasks, so they all start immediately.
+# Python threads cannot be cancelled once running: if an iteration exits early,
+# its in-flight HTTP/DB calls finish in the background and their results are
+# discarded.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="wahoo-io")
+
+# ISO8601 UTC format with a literal "Z" suffix (API expects this format)
+ISO_Z = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+LOG_BANNER = "=" * 70
+
+
+class BlockCache:
+    """
+    Current chain block, fetched at most once per block time.
+
+    One instance per iteration lets the metagraph sync and weight setting
+    share a single block-number RPC.
+    """
+
+    def __init__(self, subtensor: bt.Subtensor, ttl: float = BLOCK_TIME_SECONDS):
+        self.subtensor = subtensor
+        self.ttl = ttl
+        self.block: Optional[int] = None
+        self.fetched_at = 0.0
+
+    def get(self) -> Optional[int]:
+        now = time.monotonic()
+        if self.block is not None and now - self.fetched_at < self.ttl:
+            return self.block
+        try:
+            self.block = int(self.subtensor.get_current_block())
+            self.fetched_at = now
+        except Exception as e:
+            logger.debug("Could not fetch current block: %s", e)
+            self.block = None
+        return self.block
+
 
 def calculate_epoch_timestamps(
     subtensor: bt.Subtensor,
@@ -93,12 +149,16 @@ def calculate_epoch_timestamps(
         )
 
         # Format as ISO8601 strings (API expects this format)
-        start_date = epoch_start_time.isoformat().replace("+00:00", "Z")
-        end_date = epoch_end_time.isoformat().replace("+00:00", "Z")
+        start_date = epoch_start_time.strftime(ISO_Z)
+        end_date = epoch_end_time.strftime(ISO_Z)
 
         logger.debug(
-            f"Epoch {current_epoch}: blocks {epoch_start_block}-{epoch_end_block}, "
-            f"timestamps {start_date} to {end_date}"
+            "Epoch %d: blocks %d-%d, timestamps %s to %s",
+            current_epoch,
+            epoch_start_block,
+            epoch_end_block,
+            start_date,
+            end_date,
         )
 
         return start_date, end_date
@@ -108,9 +168,65 @@ def calculate_epoch_timestamps(
         return None, None
 
 
-def load_validator_config() -> Dict[str, Any]:
-    wallet_name = os.getenv("WALLET_NAME")
-    hotkey_name = os.getenv("HOTKEY_NAME")
+@lru_cache(maxsize=1)
+def load_env_settings() -> Mapping[str, Any]:
+    """
+    Read every validator environment variable once per process.
+
+    Unlike load_validator_config(), missing wallet settings are returned as
+    None so the CLI can still supply them.
+    """
+    return MappingProxyType(
+        {
+            "netuid": int(os.getenv("NETUID", "0")),
+            "network": os.getenv("NETWORK", "finney"),
+            "chain_endpoint": os.getenv("CHAIN_ENDPOINT"),
+            "wallet_name": os.getenv("WALLET_NAME"),
+            "hotkey_name": os.getenv("HOTKEY_NAME"),
+            "use_validator_db": os.getenv("USE_VALIDATOR_DB", "false").lower() == "true",
+            "validator_db_path": os.getenv("VALIDATOR_DB_PATH", "validator.db"),
+            "log_level": os.getenv("LOG_LEVEL", "INFO"),
+            "sync_block_delta": int(
+                os.getenv("SYNC_BLOCK_DELTA", str(DEFAULT_SYNC_BLOCK_DELTA))
+            ),
+            "use_dataframe_scoring": os.getenv("USE_DATAFRAME_SCORING", "false").lower() == "true",
+            "wahoo_api_url": os.getenv("WAHOO_API_URL", WAHOO_API_URL),
+            "wahoo_validation_endpoint": os.getenv(
+                "WAHOO_VALIDATION_ENDPOINT", WAHOO_VALIDATION_ENDPOINT
+            ),
+        }
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatorConfig:
+    netuid: int
+    network: str
+    wallet_name: str
+    hotkey_name: str
+    use_validator_db: bool = False
+    wahoo_api_url: str = WAHOO_API_URL
+    wahoo_validation_endpoint: str = WAHOO_VALIDATION_ENDPOINT
+    chain_endpoint: Optional[str] = None
+    sync_block_delta: int = DEFAULT_SYNC_BLOCK_DELTA
+    # Score through the pandas DataFrame path instead of column arrays
+    use_dataframe_scoring: bool = False
+    # Seed EMA scores used when the DB has none
+    ema_scores: Mapping[str, float] = field(default_factory=dict)
+
+
+@lru_cache(maxsize=1)
+def load_validator_config() -> ValidatorConfig:
+    """
+    Build the validator config from environment variables.
+
+    The result is cached for the lifetime of the process, so environment
+    changes require a restart to take effect. The config is frozen; derive
+    modified copies with dataclasses.replace().
+    """
+    env = load_env_settings()
+    wallet_name = env["wallet_name"]
+    hotkey_name = env["hotkey_name"]
 
     if not wallet_name or not hotkey_name:
         raise ValueError(
@@ -118,15 +234,15 @@ def load_validator_config() -> Dict[str, Any]:
             "Example: export WALLET_NAME=my_wallet HOTKEY_NAME=my_hotkey"
         )
 
-    return {
-        "netuid": int(os.getenv("NETUID", "0")),
-        "network": os.getenv("NETWORK", "finney"),
-        "wallet_name": wallet_name,
-        "hotkey_name": hotkey_name,
-        "use_validator_db": os.getenv("USE_VALIDATOR_DB", "false").lower() == "true",
-        "wahoo_api_url": WAHOO_API_URL,
-        "wahoo_validation_endpoint": WAHOO_VALIDATION_ENDPOINT,
-    }
+    return ValidatorConfig(
+        netuid=env["netuid"],
+        network=env["network"],
+        wallet_name=wallet_name,
+        hotkey_name=hotkey_name,
+        use_validator_db=env["use_validator_db"],
+        sync_block_delta=env["sync_block_delta"],
+        use_dataframe_scoring=env["use_dataframe_scoring"],
+    )
 
 
 def initialize_bittensor(
@@ -177,10 +293,36 @@ def initialize_bittensor(
     return wallet, subtensor, dendrite, metagraph
 
 
-def sync_metagraph(metagraph: bt.Metagraph, subtensor: bt.Subtensor) -> bt.Metagraph:
+def sync_metagraph(
+    metagraph: bt.Metagraph,
+    subtensor: bt.Subtensor,
+    min_block_delta: int = DEFAULT_SYNC_BLOCK_DELTA,
+    block: Optional[int] = None,
+) -> bt.Metagraph:
+    """
+    Sync the metagraph, skipping the full state download until the chain has
+    advanced at least min_block_delta blocks past the last synced block.
+    Pass block= when the current block is already known.
+    """
+    try:
+        current_block = int(block if block is not None else subtensor.get_current_block())
+        synced_block = getattr(metagraph, "block", None)
+        if synced_block is not None:
+            if hasattr(synced_block, "item"):
+                synced_block = synced_block.item()
+            if current_block - int(synced_block) < max(1, min_block_delta):
+                logger.debug(
+                    "Metagraph synced at block %d (current %d), skipping sync",
+                    int(synced_block),
+                    current_block,
+                )
+                return metagraph
+    except Exception as e:
+        logger.debug("Could not compare metagraph block, syncing anyway: %s", e)
+
     logger.debug("Syncing metagraph...")
     metagraph.sync(subtensor=subtensor)
-    logger.debug(f"Metagraph synced: {len(metagraph.uids)} total UIDs")
+    logger.debug("Metagraph synced: %d total UIDs", len(metagraph.uids))
     return metagraph
 
 
@@ -239,7 +381,7 @@ def calculate_loop_interval(metagraph: bt.Metagraph, subtensor: Optional[bt.Subt
             )
             return max(interval, 60.0)
     except (AttributeError, TypeError, ValueError) as e:
-        logger.debug(f"Could not calculate loop interval: {e}")
+        logger.debug("Could not calculate loop interval: %s", e)
 
     logger.info(
         "Using default loop interval: 4800 seconds (tempo not available from metagraph)"
@@ -252,55 +394,84 @@ def compute_weights(
     active_uids: List[int],
     uid_to_hotkey: Dict[int, str],
     previous_scores: Optional[Dict[str, float]] = None,
-) -> tuple[Dict[str, float], Dict[str, float]]:
-    from .scoring.dataframe import records_to_dataframe
-    from .scoring.operators import EMAVolumeScorer
-
-    logger.debug("Computing weights using EMAVolumeScorer...")
-    df = records_to_dataframe(validation_data)
-
-    if df.empty:
+    use_dataframe_scoring: bool = False,
+) -> tuple[Dict[str, float], Mapping[str, float]]:
+    if not validation_data:
         logger.warning("No validation data to compute weights from")
         return {}, {}
 
+    logger.debug("Computing weights using EMAVolumeScorer...")
     scorer = EMAVolumeScorer()
-    result = scorer.run(df, previous_scores=previous_scores)
-    weights: Dict[str, float] = {}
 
-    hotkeys = df["hotkey"].to_numpy()
-    for i, hotkey in enumerate(hotkeys):
-        weight = float(result.weights[i])
-        if weight > 0:
-            weights[hotkey] = weight
+    if use_dataframe_scoring:
+        df = records_to_dataframe(validation_data)
+        result = scorer.run(df, previous_scores=previous_scores)
+        hotkeys = df["hotkey"].to_numpy()
+    else:
+        columns = records_to_soa(validation_data, columns=("profit",))
+        hotkeys = columns["hotkey"]
+        result = scorer.run_arrays(
+            hotkeys, columns["profit"], previous_scores=previous_scores
+        )
+
+    weight_values = np.asarray(result.weights, dtype=np.float64)
+    # Only active miners can receive weight; drop the rest before building the dict.
+    # np.isin on object arrays compares every pair, so test membership via a set.
+    active = set(uid_to_hotkey.values())
+    keep = (weight_values > 0) & np.fromiter(
+        (hotkey in active for hotkey in hotkeys), dtype=bool, count=len(hotkeys)
+    )
+    weights: Dict[str, float] = dict(
+        zip(hotkeys[keep].tolist(), weight_values[keep].tolist())
+    )
 
-    updated_scores: Dict[str, float] = result.meta.get("smoothed_scores", {})
+    meta = result.meta
+    # EMAState: array-backed mapping, avoids building a per-hotkey score dict
+    updated_scores: Mapping[str, float] = meta.get("smoothed_scores", {})
 
     logger.info(
-        f"EMA Scoring: {result.meta['total_miners']} miners, "
-        f"{result.meta['new_miners']} new, "
-        f"{result.meta['active_miners']} active (weight > 0), "
-        f"max_weight={result.meta['max_weight']:.6f}"
+        "EMA Scoring: %d miners, %d new, %d active (weight > 0), max_weight=%.6f",
+        meta["total_miners"],
+        meta["new_miners"],
+        meta["active_miners"],
+        meta["max_weight"],
     )
-    logger.debug(f"Scoring metadata: {result.meta}")
+    logger.debug("Scoring metadata: %s", meta)
 
     return weights, updated_scores
 
 
+def _load_previous_scores(
+    validator_db: Optional[Any], config: ValidatorConfig
+) -> Dict[str, float]:
+    previous_ema_scores: Dict[str, float] = {}
+    if validator_db is not None:
+        try:
+            raw_scores = validator_db.get_latest_scores()
+            if raw_scores:
+                previous_ema_scores = validate_ema_scores(raw_scores)
+                logger.info(
+                    "Loaded %d valid EMA scores from database", len(previous_ema_scores)
+                )
+        except Exception as e:
+            logger.warning(f"Failed to load EMA scores from DB: {e}")
+            previous_ema_scores = {}
+
+    if not previous_ema_scores:
+        previous_ema_scores = dict(config.ema_scores)
+    return previous_ema_scores
+
+
 def _track_user_hotkey_changes(
     validator_db: Any,
     validation_data: List[Any],
     previous_scores: Dict[str, float],
-    new_scores: Dict[str, float],
+    new_scores: Mapping[str, float],
 ) -> None:
     for record in validation_data:
         hotkey = record.hotkey
         user_id = getattr(record, 'wahoo_user_id', None)
-        
-        # Get volume from the record for logging
-        volume = 0.0
-        if hasattr(record, 'performance') and record.performance:
-            volume = getattr(record.performance, 'total_volume_usd', 0.0) or 0.0
-        
+
         # Update binding and check for userId changes
         previous_user_id, is_new_hotkey = validator_db.update_user_hotkey_binding(
             user_id=user_id,
@@ -312,7 +483,10 @@ def _track_user_hotkey_changes(
             # Get previous and new weights/scores
             prev_weight = previous_scores.get(hotkey, 0.0)
             new_weight = new_scores.get(hotkey, 0.0)
-            
+            # Volume is only needed for this log line, so read it here
+            performance = getattr(record, 'performance', None)
+            volume = (getattr(performance, 'total_volume_usd', 0.0) or 0.0) if performance else 0.0
+
             # Log the userId change with all required information
             logger.warning(
                 f"USER_ID_CHANGE DETECTED: "
@@ -331,14 +505,15 @@ def main_loop_iteration(
     dendrite: bt.Dendrite,
     metagraph: bt.Metagraph,
     netuid: int,
-    config: Dict[str, Any],
+    config: ValidatorConfig,
     validator_db: Optional[Any] = None,
     iteration_count: int = 0,
 ) -> None:
     iteration_start = time.time()
-    logger.info("=" * 70)
+    iteration_now = datetime.now(timezone.utc)
+    logger.info(LOG_BANNER)
     logger.info("Starting main loop iteration")
-    logger.info("=" * 70)
+    logger.info(LOG_BANNER)
 
     if validator_db is not None and hasattr(validator_db, "cleanup_old_cache"):
         try:
@@ -355,64 +530,77 @@ def main_loop_iteration(
         except Exception as cleanup_error:
             logger.warning(f"Database cleanup failed: {cleanup_error}")
 
+    block_cache = BlockCache(subtensor)
+
     try:
+        # The event ID does not depend on the metagraph, so fetch it in the
+        # background while we sync.
+        event_id_future = _IO_EXECUTOR.submit(
+            get_active_event_id, api_base_url=config.wahoo_api_url
+        )
+
         logger.info("[1/8] Syncing metagraph...")
-        metagraph = sync_metagraph(metagraph, subtensor)
-        logger.info(f"✓ Metagraph synced: {len(metagraph.uids)} total UIDs")
+        metagraph = sync_metagraph(
+            metagraph,
+            subtensor,
+            min_block_delta=config.sync_block_delta,
+            block=block_cache.get(),
+        )
+        n_uids = len(metagraph.uids)
+        owner_in_metagraph = OWNER_UID < n_uids
+        logger.info("✓ Metagraph synced: %d total UIDs", n_uids)
 
         logger.info("[2/8] Getting active UIDs...")
-        active_uids = get_active_uids(metagraph)
+        active_view = get_active_view(metagraph)
+        active_uids = active_view.active_uids
         if not active_uids:
             logger.warning("No active UIDs found, skipping iteration")
             return
-        logger.info(f"✓ Found {len(active_uids)} active UIDs")
+        logger.info("✓ Found %d active UIDs", len(active_uids))
 
         logger.info("[3/8] Extracting hotkeys...")
-        uid_to_hotkey = build_uid_to_hotkey(metagraph, active_uids=active_uids)
-        hotkeys = [uid_to_hotkey[uid] for uid in active_uids if uid in uid_to_hotkey]
-        logger.info(f"✓ Extracted {len(hotkeys)} hotkeys")
-        
+        uid_to_hotkey = active_view.uid_to_hotkey
+        hotkeys = active_view.hotkeys
+        logger.info("✓ Extracted %d hotkeys", len(hotkeys))
+
+        # Start the validation data fetch now so it overlaps the DB metadata sync
+        start_date_dt = iteration_now - timedelta(days=3)
+        start_date = start_date_dt.isoformat()
+        validation_future = _IO_EXECUTOR.submit(
+            get_wahoo_validation_data,
+            hotkeys=hotkeys,
+            start_date=start_date,
+            api_base_url=config.wahoo_validation_endpoint,
+            validator_db=validator_db,
+            check_reachable=True,
+        )
+        # Previous EMA scores don't depend on the fetch; read them meanwhile
+        previous_scores_future = _IO_EXECUTOR.submit(
+            _load_previous_scores, validator_db, config
+        )
+
         # Sync miner metadata (UID, axon_ip) to database
         if validator_db is not None:
             try:
-                # Build reverse mapping: hotkey -> UID
-                hotkey_to_uid = {hotkey: uid for uid, hotkey in uid_to_hotkey.items()}
-                
-                # Try to get axon IPs from metagraph if available
-                hotkey_to_axon_ip = {}
-                if hasattr(metagraph, "axons") and metagraph.axons is not None:
-                    for uid, hotkey in uid_to_hotkey.items():
-                        try:
-                            if uid < len(metagraph.axons) and metagraph.axons[uid] is not None:
-                                axon = metagraph.axons[uid]
-                                if hasattr(axon, "ip") and axon.ip is not None:
-                                    hotkey_to_axon_ip[hotkey] = str(axon.ip)
-                        except (IndexError, AttributeError):
-                            pass
+                hotkey_to_uid = active_view.hotkey_to_uid
                 
+                # Axon IPs come with the cached active view (same block = same IPs)
+                hotkey_to_axon_ip = active_view.hotkey_to_axon_ip
+
                 validator_db.sync_miner_metadata(
                     hotkey_to_uid=hotkey_to_uid,
                     hotkey_to_axon_ip=hotkey_to_axon_ip if hotkey_to_axon_ip else None,
                 )
-                logger.debug(f"✓ Synced miner metadata for {len(hotkey_to_uid)} miners")
+                logger.debug("✓ Synced miner metadata for %d miners", len(hotkey_to_uid))
             except Exception as e:
                 logger.warning(f"Failed to sync miner metadata: {e}")
 
         logger.info("[4/8] Fetching WAHOO validation data...")
         try:
-            from datetime import timedelta
-            start_date_dt = datetime.now(timezone.utc) - timedelta(days=3)
-            start_date = start_date_dt.isoformat()
-
-            logger.info(f"Using historical start date: {start_date} (last 3 days)")
+            logger.info("Using historical start date: %s (last 3 days)", start_date)
 
-            validation_data = get_wahoo_validation_data(
-                hotkeys=hotkeys,
-                start_date=start_date,
-                api_base_url=config.get("wahoo_validation_endpoint"),
-                validator_db=validator_db,
-            )
-            logger.info(f"✓ Fetched validation data for {len(validation_data)} miners")
+            validation_data = validation_future.result()
+            logger.info("✓ Fetched validation data for %d miners", len(validation_data))
 
             # Remove unregistered miners from database after API call
             if validator_db is not None:
@@ -433,18 +621,14 @@ def main_loop_iteration(
                     "Attempting to use last known good scores from database..."
                 )
 
-                from .scoring.fallback import get_fallback_weights_from_db
-
                 wahoo_weights = get_fallback_weights_from_db(validator_db)
-                if wahoo_weights is not None:
-                    validation_data = []
-                else:
+                if wahoo_weights is None:
                     # Even with no validation data, we still set weights with burn_rate to owner UID 176
                     logger.info(
                         "No fallback weights available, but will still set weights with "
                         f"burn_rate ({BURN_RATE*100:.1f}%) to owner UID {OWNER_UID}"
                     )
-                    validation_data = []  # Empty validation data - all miners get 0.0 weight
+                validation_data = []  # Empty validation data - all miners get 0.0 weight
             else:
                 wahoo_weights = None
 
@@ -460,8 +644,8 @@ def main_loop_iteration(
 
         logger.info("[5/8] Getting active event ID...")
         try:
-            event_id = get_active_event_id(api_base_url=config.get("wahoo_api_url"))
-            logger.info(f"✓ Active event ID: {event_id}")
+            event_id = event_id_future.result()
+            logger.info("✓ Active event ID: %s", event_id)
         except Exception as e:
             logger.warning(f"Failed to get event ID, using default: {e}")
             event_id = "wahoo_test_event"
@@ -478,73 +662,69 @@ def main_loop_iteration(
                         wahoo_weights, reason="fallback_weights"
                     )
                     logger.debug(
-                        f"Saved {len(wahoo_weights)} fallback weights to database"
+                        "Saved %d fallback weights to database", len(wahoo_weights)
                     )
                 except Exception as e:
                     logger.warning(f"Failed to save fallback weights to DB: {e}")
+        elif not validation_data:
+            # Nothing to score: skip the DB score load and dataframe build entirely
+            logger.warning("No validation data to compute weights from")
+            wahoo_weights, updated_ema_scores = {}, {}
         else:
-            previous_ema_scores = {}
-            if validator_db is not None:
-                try:
-                    from .scoring.validation import validate_ema_scores
-
-                    raw_scores = validator_db.get_latest_scores()
-                    if raw_scores:
-                        previous_ema_scores = validate_ema_scores(raw_scores)
-                        logger.info(
-                            f"Loaded {len(previous_ema_scores)} valid EMA scores from database"
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to load EMA scores from DB: {e}")
-                    previous_ema_scores = {}
-
-            if not previous_ema_scores:
-                previous_ema_scores = config.get("ema_scores", {})
+            previous_ema_scores = previous_scores_future.result()
 
             wahoo_weights, updated_ema_scores = compute_weights(
                 validation_data=validation_data,
                 active_uids=active_uids,
                 uid_to_hotkey=uid_to_hotkey,
                 previous_scores=previous_ema_scores,
+                use_dataframe_scoring=config.use_dataframe_scoring,
             )
 
-            # Track user-hotkey bindings and log any userId changes
-            # This detects when a hotkey becomes linked to a different Wahoo account
-            if validator_db is not None and validation_data:
-                try:
-                    _track_user_hotkey_changes(
-                        validator_db=validator_db,
-                        validation_data=validation_data,
-                        previous_scores=previous_ema_scores,
-                        new_scores=updated_ema_scores,
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to track user-hotkey bindings: {e}")
-
-            # Always save scoring run if we computed weights, even if empty
-            # This provides a record that computation occurred
-            if validator_db is not None:
-                try:
-                    # Save smoothed scores if available, otherwise save weights as fallback
-                    scores_to_save = updated_ema_scores if updated_ema_scores else wahoo_weights
-                    if scores_to_save:
-                        validator_db.add_scoring_run(
-                            scores_to_save, reason="ema_update"
-                        )
-                        logger.debug(
-                            f"Saved {len(scores_to_save)} EMA scores to database"
+            # Group the binding updates and the scoring run into one DB commit
+            db_transaction = (
+                validator_db.transaction()
+                if hasattr(validator_db, "transaction")
+                else nullcontext()
+            )
+            with db_transaction:
+                # Track user-hotkey bindings and log any userId changes
+                # This detects when a hotkey becomes linked to a different Wahoo account
+                if validator_db is not None and validation_data:
+                    try:
+                        _track_user_hotkey_changes(
+                            validator_db=validator_db,
+                            validation_data=validation_data,
+                            previous_scores=previous_ema_scores,
+                            new_scores=updated_ema_scores,
                         )
-                    else:
-                        logger.debug("No scores to save (empty validation data)")
-                except Exception as e:
-                    logger.warning(f"Failed to save EMA scores to DB: {e}")
-
-        logger.info(f"✓ Computed weights for {len(wahoo_weights)} miners")
+                    except Exception as e:
+                        logger.warning(f"Failed to track user-hotkey bindings: {e}")
+
+                # Always save scoring run if we computed weights, even if empty
+                # This provides a record that computation occurred
+                if validator_db is not None:
+                    try:
+                        # Save smoothed scores if available, otherwise save weights as fallback
+                        scores_to_save = updated_ema_scores if updated_ema_scores else wahoo_weights
+                        if scores_to_save:
+                            validator_db.add_scoring_run(
+                                scores_to_save, reason="ema_update"
+                            )
+                            logger.debug(
+                                "Saved %d EMA scores to database", len(scores_to_save)
+                            )
+                        else:
+                            logger.debug("No scores to save (empty validation data)")
+                    except Exception as e:
+                        logger.warning(f"Failed to save EMA scores to DB: {e}")
+
+        logger.info("✓ Computed weights for %d miners", len(wahoo_weights))
 
         logger.info("[7/8] Calculating rewards...")
         try:
             # Miner responses are not used in this subnet (miners don't run code)
-            miner_responses = [None] * len(active_uids)
+            miner_responses = np.full(len(active_uids), None, dtype=object)
             rewards = reward(
                 responses=miner_responses,
                 uids=active_uids,
@@ -553,11 +733,13 @@ def main_loop_iteration(
                 wahoo_validation_data=validation_data,
                 uid_to_hotkey=uid_to_hotkey,
             )
-            logger.info(f"✓ Calculated rewards tensor: shape={rewards.shape}")
+            logger.info("✓ Calculated rewards tensor: shape=%s", tuple(rewards.shape))
 
-            rewards_sum = rewards.sum().item()
+            # Move to host once; the sum and the final weights both read this copy
+            miner_weights = rewards.detach().cpu().numpy()
+            rewards_sum = float(miner_weights.sum())
             if rewards_sum > 0.0:
-                logger.info(f"✓ Rewards sum: {rewards_sum:.6f} (ready to set weights)")
+                logger.info("✓ Rewards sum: %.6f (ready to set weights)", rewards_sum)
             else:
                 logger.info("All miner rewards are zero (no predictions), but will still set weights with burn_rate to owner UID 176")
 
@@ -569,24 +751,28 @@ def main_loop_iteration(
             # - 0.0 to all miners (no predictions)
             owner_weight = BURN_RATE  # 0.5 = 50% burn rate
             final_uids = list(active_uids)
-            final_weights = rewards.clone()
 
             # Check if owner UID exists in metagraph
-            if OWNER_UID < len(metagraph.uids):
+            if owner_in_metagraph:
                 # Add owner UID to the list (it's a validator, not in active_uids)
                 final_uids.append(OWNER_UID)
-                # Add owner weight (burn_rate) to the weights tensor
-                final_weights = torch.cat([final_weights, torch.tensor([owner_weight], dtype=torch.float32)])
+                # Preallocate miners + owner slot and write the burn weight last
+                final_weights = np.empty(len(miner_weights) + 1, dtype=np.float32)
+                final_weights[:-1] = miner_weights
+                final_weights[-1] = owner_weight
                 logger.info(
-                    f"✓ Routed burn_rate ({BURN_RATE*100:.1f}%) to owner/validator UID {OWNER_UID} "
-                    f"with weight {owner_weight:.6f}"
+                    "✓ Routed burn_rate (%.1f%%) to owner/validator UID %d with weight %.6f",
+                    BURN_RATE * 100,
+                    OWNER_UID,
+                    owner_weight,
                 )
             else:
                 logger.warning(
                     f"Owner UID {OWNER_UID} does not exist in metagraph "
-                    f"(max UID: {len(metagraph.uids)-1}). "
+                    f"(max UID: {n_uids - 1}). "
                     f"burn_rate ({BURN_RATE*100:.1f}%) will be truly burned instead."
                 )
+                final_weights = miner_weights.astype(np.float32, copy=False)
 
         except Exception as e:
             logger.error(f"Failed to calculate rewards: {e}")
@@ -600,18 +786,23 @@ def main_loop_iteration(
                 netuid=netuid,
                 uids=final_uids,
                 weights=final_weights,
+                block=block_cache.get(),
             )
             if success and transaction_hash:
-                logger.info("=" * 70)
+                logger.info(LOG_BANNER)
                 logger.info("✓✓✓ WEIGHTS SET SUCCESSFULLY ON BLOCKCHAIN ✓✓✓")
-                logger.info("=" * 70)
-                logger.info(f"Transaction Hash: {transaction_hash}")
-                logger.info(f"Number of UIDs: {len(final_uids)}")
-                logger.info("Weight Distribution:")
-                for uid, weight in zip(final_uids, final_weights):
-                    logger.info(f"  UID {uid}: {weight:.6f} ({weight*100:.2f}%)")
-                logger.info(f"Total Weight Sum: {final_weights.sum().item():.6f}")
-                logger.info("=" * 70)
+                logger.info(LOG_BANNER)
+                logger.info("Transaction Hash: %s", transaction_hash)
+                logger.info("Number of UIDs: %d", len(final_uids))
+                # Per-UID table is O(N) to format; only build it if it will be emitted
+                if logger.isEnabledFor(logging.INFO):
+                    distribution = "\n".join(
+                        f"  UID {uid}: {weight:.6f} ({weight*100:.2f}%)"
+                        for uid, weight in zip(final_uids, final_weights.tolist())
+                    )
+                    logger.info("Weight Distribution:\n%s", distribution)
+                logger.info("Total Weight Sum: %.6f", final_weights.sum().item())
+                logger.info(LOG_BANNER)
             elif success and not transaction_hash:
                 logger.info("Weights on cooldown - will retry in next commit period (this is normal)")
             else:
@@ -620,7 +811,7 @@ def main_loop_iteration(
             logger.error(f"Failed to set weights: {e}")
 
         iteration_time = time.time() - iteration_start
-        logger.info(f"✓ Iteration complete in {iteration_time:.2f}s")
+        logger.info("✓ Iteration complete in %.2fs", iteration_time)
 
     except Exception as e:
         logger.error(f"Error in main loop iteration: {e}", exc_info=True)